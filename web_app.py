@@ -8,13 +8,19 @@ process and a simple UI to control it.
 
 from __future__ import annotations
 
-from flask import Flask, jsonify, render_template, request, send_file
+from flask import Flask, Response, jsonify, render_template, request, send_file
 import os
 from werkzeug.exceptions import BadRequest
 
 from web_cracker import PasswordCracker, CrackerConfig
 from werkzeug.utils import secure_filename
 import uuid
+from typing import Dict
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 
 app = Flask(__name__)
@@ -25,6 +31,13 @@ ARTIFACTS_DIR = os.path.join(os.path.dirname(__file__), 'artifacts')
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(ARTIFACTS_DIR, exist_ok=True)
 
+# Internal nginx location mapped to ARTIFACTS_DIR. When set, downloads are
+# handed off to nginx with X-Accel-Redirect instead of streamed by Python.
+ARTIFACTS_ACCEL_PREFIX = os.getenv("ARTIFACTS_ACCEL_PREFIX")
+
+# Tokens minted by /api/upload-zip, mapped to the path the upload was saved to
+UPLOADED_TOKENS: Dict[str, str] = {}
+
 
 def _parse_config(data: dict) -> CrackerConfig:
     try:
@@ -63,7 +76,11 @@ def index():
 
 @app.get("/api/status")
 def api_status():
-    return jsonify(cracker.status().to_dict())
+    payload = cracker.status().to_dict()
+    # Polled continuously by the UI; use the C encoder when available
+    if orjson is not None:
+        return Response(orjson.dumps(payload), mimetype="application/json")
+    return jsonify(payload)
 
 
 @app.post("/api/start")
@@ -76,8 +93,8 @@ def api_start():
         token = body.get('zip_token')
         if not token:
             return jsonify({"error": "zip_token required for zip mode"}), 400
-        zip_path = os.path.join(UPLOAD_DIR, secure_filename(str(token)))
-        if not os.path.exists(zip_path):
+        zip_path = UPLOADED_TOKENS.get(str(token))
+        if zip_path is None:
             return jsonify({"error": "uploaded file not found"}), 400
         cfg.zip_path = zip_path
         cfg.job_id = str(uuid.uuid4())
@@ -103,6 +120,7 @@ def api_upload_zip():
     token = str(uuid.uuid4()) + '_' + filename
     path = os.path.join(UPLOAD_DIR, token)
     f.save(path)
+    UPLOADED_TOKENS[token] = path
     return jsonify({"ok": True, "token": token})
 
 
@@ -111,12 +129,27 @@ def api_download():
     s = cracker.status()
     if not s.artifact_path or not os.path.exists(s.artifact_path):
         return jsonify({"error": "No artifact available"}), 404
+    if ARTIFACTS_ACCEL_PREFIX:
+        name = os.path.basename(s.artifact_path)
+        resp = Response(mimetype="application/zip")
+        resp.headers["X-Accel-Redirect"] = f"{ARTIFACTS_ACCEL_PREFIX.rstrip('/')}/{name}"
+        resp.headers["Content-Disposition"] = f"attachment; filename={name}"
+        return resp
+    # Streamed by the WSGI server; set ARTIFACTS_ACCEL_PREFIX to offload to nginx
     return send_file(s.artifact_path, as_attachment=True)
 
 
 def main():
     port = int(os.getenv("PORT", "5050"))
-    app.run(host="127.0.0.1", port=port, debug=False)
+    # Prefer waitress when installed; Flask's dev server is the fallback
+    try:
+        from waitress import serve  # type: ignore
+    except Exception:
+        serve = None  # type: ignore
+    if serve is not None:
+        serve(app, host="127.0.0.1", port=port, threads=8)
+    else:
+        app.run(host="127.0.0.1", port=port, debug=False)
 
 
 if __name__ == "__main__":
@@ -9,16 +9,272 @@ It does NOT perform any desktop automation or screen scraping.
 
 from __future__ import annotations
 
+import contextlib
 import itertools
+import multiprocessing
+import os
+import shutil
+import struct
 import threading
 import time
 import hashlib
-from dataclasses import dataclass, field
-from typing import Optional, Literal, Dict, Any
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Optional, Literal, Dict, Any, Iterable, Iterator, List, Tuple
 
 
 HashMethod = Literal["plain", "md5", "sha256", "zip"]
 
+# Number of candidates generated and hashed per round in the hash modes.
+BATCH_SIZE = 8192
+# Number of zip candidates screened per round when running unthrottled.
+ZIP_BATCH_SIZE = 256
+# Keyspaces at least this large are searched across worker processes.
+PARALLEL_MIN_CANDIDATES = 2_000_000
+# Batches handed to a worker process per shard of the keyspace.
+SHARD_BATCHES = 32
+# Seconds of sleep a throttled run aims to accumulate per batch.
+THROTTLE_INTERVAL = 0.1
+
+
+def throttled_batch_size(delay: float, batch_size: int) -> int:
+    """Return how many candidates to try between sleeps for a per-attempt ``delay``.
+
+    Throttled runs sleep once per batch for ``delay`` times the batch's
+    candidates, keeping the configured average rate while each batch still
+    runs at full speed and stop requests are seen within about
+    ``THROTTLE_INTERVAL`` seconds.
+    """
+    if not delay:
+        return batch_size
+    return max(1, min(batch_size, int(THROTTLE_INTERVAL / delay)))
+
+
+def keyspace_layout(charset: str, length: int, batch_size: int) -> Tuple[int, int, int]:
+    """Return ``(suffix_len, total_rows, rows_per_batch)`` for a keyspace.
+
+    The trailing ``suffix_len`` positions form a table shared by every
+    batch; the keyspace is then ``total_rows`` prefixes, grouped
+    ``rows_per_batch`` at a time.
+    """
+    suffix_len = 0
+    while suffix_len < length and len(charset) ** (suffix_len + 1) <= batch_size:
+        suffix_len += 1
+    total_rows = len(charset) ** (length - suffix_len)
+    rows_per_batch = max(1, batch_size // len(charset) ** suffix_len)
+    return suffix_len, total_rows, rows_per_batch
+
+
+def _digits(index: int, base: int, width: int) -> List[int]:
+    """Return the ``width`` base-``base`` digits of ``index``, most significant first."""
+    digits = [0] * width
+    for j in range(width - 1, -1, -1):
+        index, digits[j] = divmod(index, base)
+    return digits
+
+
+def prefix_batches(
+    charset: str,
+    length: int,
+    batch_size: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[Tuple[List[bytes], List[bytes]]]:
+    """Yield ``(prefixes, suffixes)`` pairs covering prefix rows ``[start, stop)``.
+
+    The trailing positions are enumerated once into a table of encoded
+    suffixes shared by every batch; each batch pairs it with as many
+    encoded prefixes as fit in ``batch_size`` candidates. Candidates are
+    ``prefix + suffix`` for each prefix, then each suffix, which matches
+    ``itertools.product`` order. The first prefix is derived from its row
+    index, so any slice of the keyspace can be searched independently;
+    later ones come from an odometer over a precomputed table of encoded
+    characters.
+    """
+    suffix_len, total_rows, rows = keyspace_layout(charset, length, batch_size)
+    suffixes = ["".join(combo).encode() for combo in itertools.product(charset, repeat=suffix_len)]
+    prefix_len = length - suffix_len
+    if stop is None or stop > total_rows:
+        stop = total_rows
+
+    base = len(charset)
+    encoded = [ch.encode() for ch in charset]
+    digits = _digits(start, base, prefix_len)
+    parts = [encoded[d] for d in digits]
+
+    for row in range(start, stop, rows):
+        batch = []
+        for _ in range(min(rows, stop - row)):
+            batch.append(b"".join(parts))
+            # Advance the odometer by one
+            for j in range(prefix_len - 1, -1, -1):
+                digit = digits[j] + 1
+                if digit < base:
+                    digits[j] = digit
+                    parts[j] = encoded[digit]
+                    break
+                digits[j] = 0
+                parts[j] = encoded[0]
+        yield batch, suffixes
+
+
+def hash_batch(method: HashMethod, prefixes: List[bytes], suffixes: List[bytes]) -> List[bytes]:
+    """Return the md5/sha256 digest of every ``prefix + suffix`` candidate, in order.
+
+    The hash state after each prefix is computed once and copied for
+    every suffix, so the shared prefix is only absorbed once per batch.
+    """
+    if method == "md5":
+        new = hashlib.md5
+    elif method == "sha256":
+        new = hashlib.sha256
+    else:
+        raise ValueError(f"hash_batch does not support method {method!r}")
+
+    values: List[bytes] = []
+    append = values.append
+    for prefix in prefixes:
+        copy = new(prefix).copy
+        for suffix in suffixes:
+            h = copy()
+            h.update(suffix)
+            append(h.digest())
+    return values
+
+
+def find_match(
+    method: HashMethod,
+    target_value: bytes,
+    prefixes: List[bytes],
+    suffixes: List[bytes],
+) -> int:
+    """Return the batch index of the candidate matching ``target_value``, or -1.
+
+    In plain mode the target is compared against the prefixes and the
+    suffix table directly, so no candidate is ever built.
+    """
+    if method == "plain":
+        for row, prefix in enumerate(prefixes):
+            if target_value.startswith(prefix):
+                try:
+                    return row * len(suffixes) + suffixes.index(target_value[len(prefix):])
+                except ValueError:
+                    pass
+        return -1
+
+    try:
+        return hash_batch(method, prefixes, suffixes).index(target_value)
+    except ValueError:
+        return -1
+
+
+def search_rows(
+    method: HashMethod,
+    target_value: bytes,
+    charset: str,
+    length: int,
+    start: int,
+    stop: int,
+) -> Tuple[int, str, Optional[str]]:
+    """Search prefix rows ``[start, stop)`` of the keyspace.
+
+    Runs in a worker process. Returns ``(attempts, last_password,
+    found_password)`` where ``found_password`` is None if nothing matched.
+    """
+    attempts = 0
+    last = ""
+    for prefixes, suffixes in prefix_batches(charset, length, BATCH_SIZE, start, stop):
+        index = find_match(method, target_value, prefixes, suffixes)
+        if index < 0:
+            attempts += len(prefixes) * len(suffixes)
+            last = (prefixes[-1] + suffixes[-1]).decode()
+            continue
+        row, col = divmod(index, len(suffixes))
+        password = (prefixes[row] + suffixes[col]).decode()
+        return attempts + index + 1, password, password
+    return attempts, last, None
+
+
+def _crc32_table() -> List[int]:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32_TABLE = _crc32_table()
+_ZIPCRYPTO_INIT_KEYS = (0x12345678, 0x23456789, 0x34567890)
+
+
+def _zipcrypto_update(keys: Tuple[int, int, int], data: bytes) -> Tuple[int, int, int]:
+    """Feed ``data`` through the ZipCrypto key schedule."""
+    crc = _CRC32_TABLE
+    key0, key1, key2 = keys
+    for byte in data:
+        key0 = (key0 >> 8) ^ crc[(key0 ^ byte) & 0xFF]
+        key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        key2 = (key2 >> 8) ^ crc[(key2 ^ (key1 >> 24)) & 0xFF]
+    return key0, key1, key2
+
+
+def zipcrypto_header(zip_path: str, info: zipfile.ZipInfo) -> Optional[Tuple[bytes, int]]:
+    """Return the 12-byte encryption header and check byte of a ZipCrypto member.
+
+    Returns None when the member is not encrypted with legacy ZipCrypto
+    (unencrypted, or WinZip AES) or its local header cannot be read.
+    """
+    if not info.flag_bits & 0x1 or info.compress_type == 99:
+        return None
+    with open(zip_path, "rb") as fp:
+        fp.seek(info.header_offset)
+        local = fp.read(30)
+        if len(local) != 30 or local[:4] != b"PK\x03\x04":
+            return None
+        name_len, extra_len = struct.unpack("<HH", local[26:30])
+        fp.seek(name_len + extra_len, os.SEEK_CUR)
+        header = fp.read(12)
+    if len(header) != 12:
+        return None
+    if info.flag_bits & 0x8:
+        # Streamed entry: the check byte is the high byte of the DOS time
+        _, _, _, hour, minute, second = info.date_time
+        check = ((hour << 11 | minute << 5 | second // 2) >> 8) & 0xFF
+    else:
+        check = (info.CRC >> 24) & 0xFF
+    return header, check
+
+
+def zipcrypto_filter(prefixes: List[bytes], suffixes: List[bytes], header: bytes, check: int) -> List[int]:
+    """Return batch indices of candidates that pass the ZipCrypto header check.
+
+    Each candidate's keys are derived (sharing the state after its prefix),
+    the 12-byte header is decrypted, and its last byte compared against
+    ``check``. About 1 in 256 wrong passwords survives; the rest are
+    rejected without touching the archive.
+    """
+    crc = _CRC32_TABLE
+    survivors = []
+    index = 0
+    for prefix in prefixes:
+        prefix_keys = _zipcrypto_update(_ZIPCRYPTO_INIT_KEYS, prefix)
+        for suffix in suffixes:
+            key0, key1, key2 = _zipcrypto_update(prefix_keys, suffix)
+            for byte in header:
+                k = key2 | 2
+                plain = byte ^ (((k * (k ^ 1)) >> 8) & 0xFF)
+                key0 = (key0 >> 8) ^ crc[(key0 ^ plain) & 0xFF]
+                key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+                key2 = (key2 >> 8) ^ crc[(key2 ^ (key1 >> 24)) & 0xFF]
+            if plain == check:
+                survivors.append(index)
+            index += 1
+    return survivors
+
 
 @dataclass
 class CrackerConfig:
@@ -32,7 +288,7 @@ class CrackerConfig:
     output_zip_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class CrackerStatus:
     is_running: bool = False
     attempts: int = 0
@@ -43,23 +299,31 @@ class CrackerStatus:
     success: bool = False
     artifact_path: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        elapsed = 0.0
-        if self.start_time:
-            elapsed = max(0.0, time.time() - self.start_time)
-        rate = (self.attempts / elapsed) if elapsed > 0 else 0.0
+    @cached_property
+    def _static_dict(self) -> Dict[str, Any]:
+        # Snapshots are immutable, so everything but the clock-dependent
+        # fields is built once per published status
         return {
             "is_running": self.is_running,
             "attempts": self.attempts,
             "current_password": self.current_password,
-            "elapsed_seconds": round(elapsed, 3),
-            "rate_per_second": round(rate, 2),
+            "elapsed_seconds": 0.0,
+            "rate_per_second": 0.0,
             "found_password": self.found_password,
             "completed": self.completed,
             "success": self.success,
             "artifact_path": self.artifact_path,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = self._static_dict.copy()
+        if self.start_time:
+            elapsed = max(0.0, time.time() - self.start_time)
+            data["elapsed_seconds"] = round(elapsed, 3)
+            if elapsed > 0:
+                data["rate_per_second"] = round(self.attempts / elapsed, 2)
+        return data
+
 
 class PasswordCracker:
     """CPU-only cracking simulation suitable for a web backend."""
@@ -98,34 +362,28 @@ class PasswordCracker:
             self._should_stop = True
 
     def status(self) -> CrackerStatus:
-        with self._lock:
-            # Return a shallow copy to avoid external mutation
-            s = self._status
-            copy = CrackerStatus(
-                is_running=s.is_running,
-                attempts=s.attempts,
-                current_password=s.current_password,
-                start_time=s.start_time,
-                found_password=s.found_password,
-                completed=s.completed,
-                success=s.success,
-                artifact_path=s.artifact_path,
-            )
-            return copy
+        # Snapshots are immutable and published by a single attribute
+        # store, so readers never need the lock
+        return self._status
 
     # Internal
-    def _hash(self, password: str) -> str:
+    def _update_status(self, **changes: Any) -> None:
+        """Publish a new status snapshot with ``changes`` applied."""
+        with self._lock:
+            self._status = replace(self._status, **changes)
+
+    def _hash(self, password: str) -> bytes:
         method = self._config.method
         if method == "md5":
-            return hashlib.md5(password.encode()).hexdigest()
+            return hashlib.md5(password.encode()).digest()
         if method == "sha256":
-            return hashlib.sha256(password.encode()).hexdigest()
-        return password
+            return hashlib.sha256(password.encode()).digest()
+        return password.encode()
 
-    def _target_value(self) -> str:
-        if self._config.method in ("md5", "sha256"):
-            return self._hash(self._config.target_password)
-        return self._config.target_password
+    def _target_value(self) -> bytes:
+        # Raw digest bytes, computed once per run; candidates are compared
+        # digest-to-digest so no hex string is built per attempt
+        return self._hash(self._config.target_password)
 
     def _run(self) -> None:
         try:
@@ -141,50 +399,146 @@ class PasswordCracker:
                 return
 
             target_value = self._target_value()
+            workers = os.cpu_count() or 1
+            if (
+                not delay
+                and mode != "plain"
+                and workers > 1
+                and len(charset) ** length >= PARALLEL_MIN_CANDIDATES
+            ):
+                self._run_parallel(charset, length, target_value, workers)
+                return
 
-            for combo in itertools.product(charset, repeat=length):
-                with self._lock:
-                    if self._should_stop:
-                        self._status.is_running = False
-                        self._status.completed = True
-                        self._status.success = False
-                        return
-
-                password = "".join(combo)
+            batch_size = throttled_batch_size(delay, BATCH_SIZE)
 
-                # Update status
-                with self._lock:
-                    self._status.current_password = password
-                    self._status.attempts += 1
+            for prefixes, suffixes in prefix_batches(charset, length, batch_size):
+                # Plain attribute read, atomic under the GIL; no lock needed
+                if self._should_stop:
+                    self._update_status(
+                        is_running=False,
+                        completed=True,
+                        success=False,
+                    )
+                    return
 
                 # Check match
-                value = self._hash(password) if self._config.method != "plain" else password
-                if value == target_value:
-                    with self._lock:
-                        self._status.found_password = password
-                        self._status.is_running = False
-                        self._status.completed = True
-                        self._status.success = True
+                index = find_match(mode, target_value, prefixes, suffixes)
+
+                if index >= 0:
+                    row, col = divmod(index, len(suffixes))
+                    password = (prefixes[row] + suffixes[col]).decode()
+                    self._update_status(
+                        current_password=password,
+                        attempts=self._status.attempts + index + 1,
+                        found_password=password,
+                        is_running=False,
+                        completed=True,
+                        success=True,
+                    )
                     return
 
+                # Update status
+                tried = len(prefixes) * len(suffixes)
+                self._update_status(
+                    current_password=(prefixes[-1] + suffixes[-1]).decode(),
+                    attempts=self._status.attempts + tried,
+                )
+
                 if delay:
-                    time.sleep(delay)
+                    time.sleep(tried * delay)
 
             # Exhausted combinations
-            with self._lock:
-                self._status.is_running = False
-                self._status.completed = True
-                self._status.success = False
+            self._update_status(
+                is_running=False,
+                completed=True,
+                success=False,
+            )
         except Exception:
             # Ensure we mark as completed on error
-            with self._lock:
-                self._status.is_running = False
-                self._status.completed = True
-                self._status.success = False
+            self._update_status(
+                is_running=False,
+                completed=True,
+                success=False,
+            )
+
+    def _run_parallel(self, charset: str, length: int, target_value: bytes, workers: int) -> None:
+        """Search the keyspace in shards spread over worker processes.
+
+        Shards are handed out lazily, a couple per worker at a time, so
+        idle workers pick up the next slice of the keyspace. On a stop or a
+        match, pending shards are cancelled and the ones already in flight
+        are waited for before the final status is published.
+        """
+        suffix_len, total_rows, rows_per_batch = keyspace_layout(charset, length, BATCH_SIZE)
+        row_size = len(charset) ** suffix_len
+        shard_rows = rows_per_batch * SHARD_BATCHES
+        shards = iter(range(0, total_rows, shard_rows))
+        method = self._config.method
+        pending: Dict[Future, int] = {}
+        latest_start = -1
+        found: Optional[str] = None
+        found_attempts = 0
+        stopped = False
+
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            def submit() -> None:
+                start = next(shards, None)
+                if start is not None:
+                    future = pool.submit(
+                        search_rows, method, target_value, charset, length, start, start + shard_rows,
+                    )
+                    pending[future] = start
+
+            for _ in range(workers * 2):
+                submit()
+
+            while pending and found is None and not stopped:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start = pending.pop(future)
+                    attempts, last, match = future.result()
+                    if match is not None:
+                        # Position of the match in itertools.product order
+                        found = match
+                        found_attempts = start * row_size + attempts
+                        break
+                    # Shards finish out of order; only move the displayed
+                    # password forwards
+                    changes: Dict[str, Any] = {"attempts": self._status.attempts + attempts}
+                    if start > latest_start:
+                        latest_start = start
+                        changes["current_password"] = last
+                    self._update_status(**changes)
+
+                stopped = self._should_stop
+                for _ in done:
+                    submit()
+        finally:
+            # Future.cancel() rather than shutdown(cancel_futures=True),
+            # which needs Python 3.9
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+        if found is not None:
+            self._update_status(
+                attempts=found_attempts,
+                current_password=found,
+                found_password=found,
+                is_running=False,
+                completed=True,
+                success=True,
+            )
+            return
+
+        self._update_status(
+            is_running=False,
+            completed=True,
+            success=False,
+        )
 
     def _run_zip(self, charset: str, length: int, delay: float) -> None:
-        import os
-        import zipfile
         try:
             import pyzipper  # type: ignore
         except Exception:
@@ -193,85 +547,115 @@ class PasswordCracker:
         zip_path = self._config.zip_path  # type: ignore[assignment]
         output_zip = self._config.output_zip_path
 
-        def try_password(pw: str) -> bool:
-            pwd_bytes = pw.encode()
-            # Try with pyzipper (AES + legacy) if available
+        with contextlib.ExitStack() as stack:
+            # Open the archive once and reuse it for every attempt
+            aes_zf = None
             if pyzipper is not None:
                 try:
-                    with pyzipper.AESZipFile(zip_path) as zf:  # type: ignore[arg-type]
-                        zf.pwd = pwd_bytes
-                        names = zf.namelist()
-                        if not names:
-                            return False
+                    aes_zf = stack.enter_context(pyzipper.AESZipFile(zip_path))  # type: ignore[arg-type]
+                except Exception:
+                    aes_zf = None
+            std_zf = stack.enter_context(zipfile.ZipFile(zip_path))  # type: ignore[arg-type]
+            # Directory entries carry no encrypted data, so validate against
+            # the first file member
+            first_name = next((i.filename for i in std_zf.infolist() if not i.is_dir()), None)
+
+            header = zipcrypto_header(zip_path, std_zf.getinfo(first_name)) if first_name else None
+
+            def try_password(pw: str) -> bool:
+                if first_name is None:
+                    return False
+                pwd_bytes = pw.encode()
+                # Try with pyzipper for AES members. ZipCrypto survivors of
+                # the header filter must pass the CRC-checked full read below;
+                # a partial read would only repeat the check-byte test.
+                if aes_zf is not None and header is None:
+                    try:
+                        aes_zf.pwd = pwd_bytes
                         # Attempt to read a small portion to validate password
-                        with zf.open(names[0]) as f:
+                        with aes_zf.open(first_name) as f:
                             _ = f.read(1)
                         return True
+                    except Exception:
+                        pass
+                # Fallback to stdlib zipfile (legacy crypto only)
+                try:
+                    _ = std_zf.read(first_name, pwd=pwd_bytes)
+                    return True
                 except Exception:
-                    pass
-            # Fallback to stdlib zipfile (legacy crypto only)
-            try:
-                with zipfile.ZipFile(zip_path) as zf:  # type: ignore[arg-type]
-                    names = zf.namelist()
-                    if not names:
-                        return False
-                    _ = zf.read(names[0], pwd=pwd_bytes)
-                return True
-            except Exception:
-                return False
-
-        for combo in itertools.product(charset, repeat=length):
-            with self._lock:
-                if self._should_stop:
-                    self._status.is_running = False
-                    self._status.completed = True
-                    self._status.success = False
-                    return
+                    return False
 
-            password = "".join(combo)
+            batch_size = throttled_batch_size(delay, ZIP_BATCH_SIZE)
 
-            with self._lock:
-                self._status.current_password = password
-                self._status.attempts += 1
+            for prefixes, suffixes in prefix_batches(charset, length, batch_size):
+                if self._should_stop:
+                    self._update_status(
+                        is_running=False,
+                        completed=True,
+                        success=False,
+                    )
+                    return
 
-            if try_password(password):
-                # Extract all contents with found password and, if requested, write an unlocked zip
-                try:
-                    extract_dir = None
-                    if output_zip:
-                        extract_dir = f"{output_zip}.d"
-                        os.makedirs(extract_dir, exist_ok=True)
-                        # Extract using pyzipper if possible for AES, else stdlib
-                        if 'pyzipper' in globals() and pyzipper is not None:
-                            with pyzipper.AESZipFile(zip_path) as zf:  # type: ignore[arg-type]
-                                zf.pwd = password.encode()
-                                zf.extractall(path=extract_dir)
-                        else:
-                            with zipfile.ZipFile(zip_path) as zf:  # type: ignore[arg-type]
-                                zf.extractall(path=extract_dir, pwd=password.encode())
-                        # Re-zip without password
-                        import shutil
-                        shutil.make_archive(output_zip, 'zip', extract_dir)
-                        artifact = f"{output_zip}.zip"
-                    else:
+                # ZipCrypto: only candidates passing the header check byte
+                # are worth a real read of the archive
+                if header is not None:
+                    candidates: Iterable[int] = zipcrypto_filter(prefixes, suffixes, *header)
+                else:
+                    candidates = range(len(prefixes) * len(suffixes))
+
+                for index in candidates:
+                    row, col = divmod(index, len(suffixes))
+                    password = (prefixes[row] + suffixes[col]).decode()
+                    if not try_password(password):
+                        continue
+
+                    # Stream every member into an unlocked zip, if requested
+                    artifact: Optional[str] = None
+                    try:
+                        if output_zip:
+                            artifact = f"{output_zip}.zip"
+                            src = aes_zf if aes_zf is not None else std_zf
+                            src.setpassword(password.encode())
+                            with zipfile.ZipFile(artifact, "w", zipfile.ZIP_DEFLATED) as dst:
+                                for info in src.infolist():
+                                    out_info = zipfile.ZipInfo(info.filename, info.date_time)
+                                    out_info.external_attr = info.external_attr
+                                    if info.is_dir():
+                                        dst.writestr(out_info, b"")
+                                        continue
+                                    out_info.compress_type = zipfile.ZIP_DEFLATED
+                                    out_info.file_size = info.file_size
+                                    with src.open(info) as fin, dst.open(out_info, "w") as fout:
+                                        shutil.copyfileobj(fin, fout, 64 * 1024)
+                    except Exception:
+                        # Don't leave a truncated artifact behind
+                        if artifact:
+                            with contextlib.suppress(OSError):
+                                os.remove(artifact)
                         artifact = None
-                except Exception:
-                    artifact = None
-
-                with self._lock:
-                    self._status.found_password = password
-                    self._status.is_running = False
-                    self._status.completed = True
-                    self._status.success = True
-                    self._status.artifact_path = artifact
-                return
 
-            if delay:
-                time.sleep(delay)
+                    self._update_status(
+                        current_password=password,
+                        attempts=self._status.attempts + index + 1,
+                        found_password=password,
+                        is_running=False,
+                        completed=True,
+                        success=True,
+                        artifact_path=artifact,
+                    )
+                    return
 
-        with self._lock:
-            self._status.is_running = False
-            self._status.completed = True
-            self._status.success = False
+                tried = len(prefixes) * len(suffixes)
+                self._update_status(
+                    current_password=(prefixes[-1] + suffixes[-1]).decode(),
+                    attempts=self._status.attempts + tried,
+                )
 
+                if delay:
+                    time.sleep(tried * delay)
 
+            self._update_status(
+                is_running=False,
+                completed=True,
+                success=False,
+            )